@@ -5,17 +5,184 @@
 # на наявність ключових слів, після чого пересилає знайдені повідомлення вам
 
 import asyncio
+import functools
 import logging
-from telethon import TelegramClient, events
+from telethon import TelegramClient, events, utils
+from telethon.sessions import StringSession
 from telethon.tl.types import PeerChannel, PeerChat, PeerUser
 import json
 import os
+import re
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
+# 🧠 pyahocorasick (pip install pyahocorasick) - необов'язкова залежність для швидкого пошуку
+# Якщо бібліотека не встановлена - використовується звичайний пошук підрядків
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# ⚡ orjson (pip install orjson) - необов'язкова залежність для швидшого читання JSON
+# Якщо бібліотека не встановлена - використовується стандартний модуль json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 🚄 hyperscan (pip install hyperscan) - необов'язковий SIMD-пошук багатьох шаблонів (лише x86-64)
+# Якщо бібліотека не встановлена - використовується pyahocorasick або регулярний вираз
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# 🏎️ uvloop (pip install uvloop, версія 0.18+) - необов'язковий швидший цикл подій asyncio
+# Недоступний на Windows - там використовується стандартний цикл подій
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    if sys.platform == 'win32' or not hasattr(uvloop, 'run'):
+        uvloop = None
+
 # Налаштування системи логування (для відображення інформації про роботу скрипта)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 📬 Налаштування пакетного надсилання сповіщень
+MAX_BATCH = 10  # Максимум сповіщень, що об'єднуються в одне повідомлення
+MAX_WAIT_MS = 300  # Скільки чекати на наступні сповіщення перед надсиланням (мс)
+MAX_QUEUE_SIZE = 1000  # Розмір черги сповіщень (щоб пам'ять не росла без меж)
+MAX_MESSAGE_LENGTH = 4096  # Ліміт довжини одного повідомлення в Telegram (у кодових одиницях UTF-16)
+BATCH_SEPARATOR = '\n\n---\n\n'  # Роздільник сповіщень в одному повідомленні
+SHUTDOWN_FLUSH_TIMEOUT = 10  # Скільки чекати на надсилання залишку черги при зупинці (секунд)
+_FLUSH_STOP = object()  # Сигнал для _flush_loop: надіслати все, що вже в черзі, і завершитися
+
+# 📊 Як часто надсилати статус роботи бота (секунд)
+STATUS_INTERVAL = 600
+ERROR_RETRY_DELAY = 60  # Пауза перед повторною спробою після помилки (секунд)
+
+# 🚦 Скільки чатів перевіряти одночасно при запуску (щоб не отримати FloodWait від Telegram)
+MAX_CONCURRENT_FETCHES = 8
+
+# 🔁 Скільки останніх пересланих повідомлень пам'ятати для захисту від повторів
+MAX_SEEN_MESSAGES = 10_000
+
+# 👤 Скільки відправників тримати в кеші, щоб не запитувати їх у Telegram повторно
+MAX_CACHED_SENDERS = 1024
+
+# 📋 Шаблони повідомлень бота (заповнюються через str.format_map)
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+NOTIFICATION_TEMPLATE = (
+    "🔔 ЗНАЙДЕНО КЛЮЧОВІ СЛОВА: {keywords}\n"
+    "\n"
+    "📍 Група/Канал: {chat}\n"
+    "👤 Відправник: {sender}\n"
+    "📅 Час: {date}\n"
+    "\n"
+    "💬 Повідомлення:\n"
+    "{text}\n"
+    "\n"
+    "---\n"
+    "ID повідомлення: {message_id}\n"
+    "ID чату: {chat_id}"
+)
+STATUS_TEMPLATE = (
+    "🤖 СТАТУС БОТА - БОТ ПРАЦЮЄ\n"
+    "\n"
+    "⏰ Час роботи: {hours}г {minutes}хв\n"
+    "🔍 Перевірено повідомлень: {messages_checked}\n"
+    "📨 Знайдено повідомлень: {messages_found}\n"
+    "📅 Останнє оновлення: {date}\n"
+    "\n"
+    "✅ Бот активний та моніторить групи в реальному часі\n"
+    "🔑 Ключових слів у базі: {keywords_count}\n"
+    "\n"
+    "---\n"
+    "Наступний статус через {next_status} хвилин"
+)
+ERROR_TEMPLATE = (
+    "⚠️ ПОМИЛКА В РОБОТІ БОТА\n"
+    "\n"
+    "❌ Опис помилки: {error}\n"
+    "📅 Час помилки: {date}\n"
+    "\n"
+    "🔄 Бот спробує відновити роботу через {retry_delay} с"
+)
+
+
+def _collect_match_id(keyword_id, start, end, flags, found_ids):
+    """
+    🚄 Обробник збігів hyperscan: зберігає ID знайденого ключового слова
+    """
+    found_ids.append(keyword_id)
+
+
+def telegram_length(text):
+    """
+    📏 Довжина тексту так, як її рахує Telegram - у кодових одиницях UTF-16
+
+    len() рахує символи Unicode, а емодзі на кшталт 🔔 займають у UTF-16 дві одиниці
+    """
+    return len(text.encode('utf-16-le')) // 2
+
+
+def truncate_text(text, limit):
+    """
+    ✂️ Обрізання тексту до limit кодових одиниць UTF-16 (разом із символом '…' в кінці)
+
+    Текст ріжеться по байтах UTF-16, тому емодзі не розрізається навпіл
+    """
+    if telegram_length(text) <= limit:
+        return text
+    cut = text.encode('utf-16-le')[:2 * max(limit - 1, 0)]
+    return cut.decode('utf-16-le', errors='ignore') + '…'
+
+
+def read_json_file(path):
+    """
+    📖 Читання JSON файлу (через orjson, якщо він встановлений)
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_json_file_cached(path, mtime):
+    """
+    📖 Кешоване читання JSON файлу (mtime у ключі кешу - змінений файл читається заново)
+    """
+    return read_json_file(path)
+
+
+def read_keywords_file(path):
+    """
+    📖 Читання файлу з ключовими словами з кешем за часом зміни файлу
+
+    Повторне завантаження незміненого файлу (напр. при перезавантаженні ключових слів)
+    не читає і не розбирає його знову
+    """
+    return _read_json_file_cached(path, os.path.getmtime(path))
+
+
+def write_json_file(path, data):
+    """
+    💾 Запис JSON файлу з відступами та без екранування не-ASCII символів
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
 
 class TelegramMonitor:
     """
@@ -28,7 +195,8 @@ class TelegramMonitor:
     - Пересилання знайдених повідомлень
     """
 
-    def __init__(self, api_id, api_hash, phone_number, target_user_id, keywords_file='keywords.json'):
+    def __init__(self, api_id, api_hash, phone_number, target_user_id, keywords_file='keywords.json',
+                 seen_file='seen_messages.json', session_string_file='session_string.txt'):
         """
         🔧 Ініціалізація Telegram монітора
 
@@ -38,6 +206,8 @@ class TelegramMonitor:
             phone_number: Номер телефону для авторизації (формат: +380XXXXXXXXX)
             target_user_id: ID користувача, якому надсилати повідомлення (число)
             keywords_file: Файл з ключовими словами (за замовчуванням: keywords.json)
+            seen_file: Файл з уже пересланими повідомленнями (за замовчуванням: seen_messages.json)
+            session_string_file: Файл із сесією у вигляді рядка (за замовчуванням: session_string.txt)
         """
         # 💾 Збереження налаштувань
         self.api_id = api_id
@@ -45,25 +215,87 @@ class TelegramMonitor:
         self.phone_number = phone_number
         self.target_user_id = target_user_id
         self.keywords_file = keywords_file
+        self.seen_file = seen_file
+        self.session_string_file = session_string_file
 
         # 📝 Завантаження ключових слів з файлу keywords.json
         self.keywords = self.load_keywords()
 
+        # ✂️ Слова для пошуку: без тих, що містять коротше ключове слово (вони перевіряються
+        # лише після збігу коротшого слова - див. prune_keywords)
+        self._match_keywords, self._longer_keywords = self.prune_keywords(self.keywords)
+
+        # 📏 Довжина найкоротшого ключового слова: коротші повідомлення не можуть містити жодного
+        self._min_kw_len = min(map(len, self._match_keywords), default=0)
+
+        # 🚄 База hyperscan для SIMD-пошуку всіх ключових слів за один прохід по тексту
+        self._hs_db = self.build_hyperscan_db(self._match_keywords)
+        self._hs_scratch = hyperscan.Scratch(self._hs_db) if self._hs_db is not None else None
+
+        # 🧠 Автомат Ахо–Корасік для пошуку всіх ключових слів за один прохід по тексту
+        self._ac = self.build_automaton(self._match_keywords) if self._hs_db is None else None
+
+        # 🔎 Запасний варіант без hyperscan і pyahocorasick - скомпільований регулярний вираз
+        self._kw_re = (self.build_pattern(self._match_keywords)
+                       if self._hs_db is None and self._ac is None else None)
+        if self._hs_db is not None:
+            logger.info(f"🚄 Пошук {len(self.keywords)} ключових слів: hyperscan")
+        elif self._ac is not None:
+            logger.info(f"🧠 Пошук {len(self.keywords)} ключових слів: автомат Ахо–Корасік")
+        else:
+            logger.info(f"🔎 Пошук {len(self.keywords)} ключових слів: регулярний вираз "
+                        f"(для швидшого пошуку встановіть pyahocorasick)")
+
         # 🔗 Створення Telegram клієнта
-        # 'session_name' - файл для збереження сесії (щоб не авторизуватися щоразу)
-        self.client = TelegramClient('session_name', api_id, api_hash)
+        # Перший запуск: 'session_name' - SQLite файл для збереження сесії (щоб не авторизуватися щоразу),
+        # після авторизації сесія експортується рядком у session_string.txt.
+        # Наступні запуски: StringSession у пам'яті - без запису в SQLite при кожному оновленні
+        # sequential_updates=False - оновлення з різних чатів обробляються паралельно
+        self._session_string = self.load_session_string()
+        session = 'session_name'
+        if self._session_string is not None:
+            try:
+                session = StringSession(self._session_string)
+            except Exception as e:
+                # 🩹 Пошкоджений файл - авторизація через SQLite, рядок перезапишеться після входу
+                logger.error(f"❌ Пошкоджена сесія у {self.session_string_file}, використовується session_name: {e}")
+                self._session_string = None
+        self.client = TelegramClient(session, api_id, api_hash,
+                                     sequential_updates=False, receive_updates=True)
         
-        # ⏰ Час останньої перевірки повідомлень (з timezone)
+        # ⏰ З якого моменту перевіряти історію при запуску (з timezone)
+        # Нові повідомлення після запуску надходять через обробник подій on_new_message
         self.last_check_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-        
-        # 📊 Час останнього статус повідомлення
-        self.last_status_time = datetime.now(timezone.utc)
-        
+
+        # 👤 ID власного акаунту (заповнюється після авторизації у start)
+        self._me_id = None
+
+        # 🔁 Вже переслані повідомлення (chat_id, message_id) - щоб не пересилати повторно після перезапуску
+        self._seen = self.load_seen()
+        # 📬 Повідомлення, сповіщення про які ще в черзі (у _seen потрапляють лише після надсилання)
+        self._in_flight = set()
+
+        # 👤 Кеш відправників за sender_id (найдавніше використані видаляються першими)
+        self._sender_cache = OrderedDict()
+
+        # 📬 Черга сповіщень для пакетного надсилання (обробляється у _flush_loop)
+        self._out_q = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        self._flush_task = None
+
+        # 📋 Збережений список груп/каналів (get_dialogs - важкий запит, потрібен лише при запуску)
+        self._monitored_dialogs = None
+
+        # 🚦 Обмеження кількості одночасних запитів історії чатів
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        # 📊 Фонова задача відправки статусу (запускається у start)
+        self._status_task = None
+
         # 📈 Статистика роботи бота
         self.stats = {
-            'total_checks': 0,
+            'messages_checked': 0,
             'total_messages_found': 0,
-            'start_time': datetime.now(timezone.utc)
+            'start_monotonic': time.monotonic()  # Для підрахунку часу роботи (не залежить від змін системного часу)
         }
 
     def load_keywords(self):
@@ -71,14 +303,13 @@ class TelegramMonitor:
         📂 Завантаження ключових слів з файлу keywords.json
 
         Якщо файл не існує - створює його з прикладами ключових слів
-        Повертає список ключових слів у нижньому регістрі для пошуку
+        Повертає ключові слова, приведені до єдиного регістру (casefold) для пошуку
         """
         try:
             if os.path.exists(self.keywords_file):
                 # 📖 Читання існуючого файлу з ключовими словами
-                with open(self.keywords_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [keyword.lower() for keyword in data.get('keywords', [])]
+                data = read_keywords_file(self.keywords_file)
+                return self.normalize_keywords(data.get('keywords', []))
             else:
                 # 📝 Створення файлу з прикладами ключових слів (якщо файл не існує)
                 default_keywords = {
@@ -91,13 +322,145 @@ class TelegramMonitor:
                         "дедлайн"
                     ]
                 }
-                with open(self.keywords_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_keywords, f, ensure_ascii=False, indent=2)
+                write_json_file(self.keywords_file, default_keywords)
                 logger.info(f"📝 Створено файл {self.keywords_file} з прикладами ключових слів")
-                return [keyword.lower() for keyword in default_keywords['keywords']]
+                return self.normalize_keywords(default_keywords['keywords'])
         except Exception as e:
             logger.error(f"❌ Помилка завантаження ключових слів: {e}")
-            return []
+            return ()
+
+    def normalize_keywords(self, keywords):
+        """
+        🧹 Підготовка ключових слів до пошуку
+
+        - відкидає порожні рядки, рядки з пробілів та не-рядкові значення
+          (порожнє ключове слово містилося б у будь-якому повідомленні); решта слів
+          лишається як є, разом із пробілами по краях (напр. ' ai ' як слово окремо)
+        - приводить до єдиного регістру через casefold (коректно і для кирилиці, і для 'ß')
+          та прибирає повтори (рядки інтернуються через sys.intern)
+        - сортує від довших до коротших, щоб найвибірковіші слова перевірялися першими
+
+        Args:
+            keywords: Список ключових слів з файлу
+
+        Returns:
+            tuple: Підготовлені ключові слова (кортеж - незмінний і швидший для перебору)
+        """
+        cleaned = {keyword.casefold() for keyword in keywords if isinstance(keyword, str) and keyword.strip()}
+
+        dropped = len(keywords) - len(cleaned)
+        if dropped:
+            logger.info(f"🧹 Відкинуто {dropped} порожніх або повторних ключових слів")
+
+        return tuple(sorted(map(sys.intern, cleaned), key=lambda k: (-len(k), k)))
+
+    def prune_keywords(self, keywords):
+        """
+        ✂️ Відбір ключових слів для пошуку
+
+        Слово, що містить інше, коротше ключове слово, не додається до пошуку: повідомлення
+        з ним і так буде знайдене за коротшим словом. Такі слова перевіряються звичайним
+        пошуком підрядка лише в повідомленнях, де знайдено коротше слово, тож у сповіщенні
+        вказуються всі ключові слова з файлу, що є в повідомленні
+
+        Args:
+            keywords: Підготовлені ключові слова (див. normalize_keywords)
+
+        Returns:
+            tuple: (слова для пошуку, словник коротке слово -> довші слова, що його містять)
+        """
+        kept = []
+        longer = {}
+        # ✂️ Перевірка O(K²) виконується один раз при запуску
+        for keyword in sorted(keywords, key=lambda k: (len(k), k)):
+            shorter = [kept_keyword for kept_keyword in kept if kept_keyword in keyword]
+            if not shorter:
+                kept.append(keyword)
+            for kept_keyword in shorter:
+                longer.setdefault(kept_keyword, []).append(keyword)
+
+        if len(kept) < len(keywords):
+            logger.info(f"✂️ {len(keywords) - len(kept)} з {len(keywords)} ключових слів "
+                        f"перевіряються лише після збігу коротшого слова, яке вони містять")
+
+        kept.sort(key=lambda k: (-len(k), k))
+        return tuple(kept), {keyword: tuple(words) for keyword, words in longer.items()}
+
+    def build_hyperscan_db(self, keywords):
+        """
+        🚄 Компіляція бази hyperscan з ключових слів
+
+        Ключові слова компілюються як літерали у байтах UTF-8. Прапорець CASELESS у hyperscan
+        працює лише для ASCII, тому текст перед пошуком так само приводиться до єдиного регістру (casefold)
+
+        Args:
+            keywords: Список ключових слів після casefold
+
+        Returns:
+            hyperscan.Database або None, якщо hyperscan недоступний чи список порожній
+        """
+        if hyperscan is None or not keywords:
+            return None
+
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[keyword.encode('utf-8') for keyword in keywords],
+                ids=list(range(len(keywords))),
+                elements=len(keywords),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,  # Кожне слово повідомляється лише один раз
+                literal=True
+            )
+            return database
+        except Exception as e:
+            # Напр. процесор без підтримки SSSE3 або бібліотека без literal-компілятора
+            logger.error(f"❌ Помилка компіляції бази hyperscan: {e}")
+            return None
+
+    def build_automaton(self, keywords):
+        """
+        🧠 Побудова автомата Ахо–Корасік з ключових слів
+
+        Автомат будується один раз при запуску і дозволяє знайти всі ключові слова
+        за один прохід по тексту повідомлення, незалежно від їх кількості
+
+        Args:
+            keywords: Список ключових слів після casefold
+
+        Returns:
+            Automaton або None, якщо pyahocorasick не встановлено чи список порожній
+        """
+        if ahocorasick is None or not keywords:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def build_pattern(self, keywords):
+        """
+        🔎 Побудова одного регулярного виразу з усіх ключових слів
+
+        Використовується, якщо pyahocorasick не встановлено. Альтернатива загорнута у
+        випереджальну перевірку (?=(...)), тож findall перевіряє кожну позицію тексту і знаходить
+        і збіги, що перекриваються (напр. 'work' і 'kit' у 'workit'). Довші слова йдуть першими,
+        щоб у кожній позиції бралося найдовше слово. Вираз чутливий до регістру:
+        текст перед пошуком проходить casefold (як і ключові слова), а пошук без IGNORECASE
+        у рази швидший для кирилиці і коректно знаходить слова на кшталт 'ß' -> 'ss'
+
+        Args:
+            keywords: Список ключових слів після casefold
+
+        Returns:
+            re.Pattern або None, якщо список порожній
+        """
+        if not keywords:
+            return None
+
+        alternation = '|'.join(sorted(map(re.escape, keywords), key=len, reverse=True))
+        return re.compile(f'(?=({alternation}))')
 
     def check_keywords(self, message_text):
         """
@@ -109,19 +472,148 @@ class TelegramMonitor:
         Returns:
             list: Список знайдених ключових слів або порожній список
         """
-        if not message_text:
+        if not message_text or not self.keywords:
             return []
 
-        # 🔤 Переведення тексту в нижній регістр для пошуку
-        message_lower = message_text.lower()
-        found_keywords = []
+        # 🔤 Приведення тексту до єдиного регістру через casefold (так само, як ключових слів)
+        # ASCII-текст у нижньому регістрі casefold не змінює - використовуємо його без створення копії
+        if message_text.isascii() and message_text.islower():
+            message_folded = message_text
+        else:
+            message_folded = message_text.casefold()
 
-        # 🔎 Пошук кожного ключового слова в тексті
-        for keyword in self.keywords:
-            if keyword in message_lower:
-                found_keywords.append(keyword)
+        # 📏 Тексти, коротші за найкоротше ключове слово, пропускаємо без пошуку
+        # (довжина перевіряється після casefold, бо він може подовжити текст: 'ß' -> 'ss')
+        if len(message_folded) < self._min_kw_len:
+            return []
 
-        return found_keywords
+        # 🚄 Найшвидший шлях: SIMD-пошук hyperscan по байтах UTF-8
+        if self._hs_db is not None:
+            found_ids = []
+            self._hs_db.scan(message_folded.encode('utf-8'), match_event_handler=_collect_match_id,
+                             context=found_ids, scratch=self._hs_scratch)
+            found = [self._match_keywords[keyword_id] for keyword_id in found_ids]
+
+        # 🧠 Швидкий шлях: один прохід автомата замість окремого пошуку кожного слова
+        elif self._ac is not None:
+            found = [keyword for _, keyword in self._ac.iter(message_folded)]
+
+        # 🔎 Без hyperscan і pyahocorasick - один прохід скомпільованого регулярного виразу
+        # (findall повертає вміст групи з випереджальної перевірки - див. build_pattern)
+        else:
+            found = self._kw_re.findall(message_folded)
+
+        # ➕ Довші ключові слова перевіряються лише для знайдених коротших, які вони містять
+        # (dict.fromkeys прибирає повтори та зберігає порядок появи у тексті)
+        return list(dict.fromkeys(
+            keyword
+            for short in found
+            for keyword in (short, *self._longer_keywords.get(short, ()))
+            if keyword is short or keyword in message_folded
+        ))
+
+    def load_session_string(self):
+        """
+        🔑 Завантаження збереженої сесії-рядка з файлу session_string.txt
+
+        Returns:
+            str або None, якщо файлу ще немає (перший запуск) чи він порожній
+        """
+        try:
+            if os.path.exists(self.session_string_file):
+                with open(self.session_string_file, 'r', encoding='utf-8') as f:
+                    return f.read().strip() or None
+        except Exception as e:
+            logger.error(f"❌ Помилка завантаження сесії: {e}")
+        return None
+
+    def save_session_string(self):
+        """
+        🔑 Експорт поточної сесії у файл session_string.txt (доступний лише власнику)
+
+        Файл перезаписується лише тоді, коли сесія відрізняється від завантаженої
+        (перший запуск, пошкоджений файл або повторна авторизація після відкликання сесії)
+
+        ⚠️ Рядок сесії дає повний доступ до акаунту - не передавайте цей файл нікому
+        """
+        try:
+            session_string = StringSession.save(self.client.session)
+            if session_string == self._session_string:
+                return
+
+            fd = os.open(self.session_string_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(session_string)
+            self._session_string = session_string
+            logger.info(f"🔑 Сесію збережено у {self.session_string_file} - наступні запуски працюватимуть без SQLite")
+        except Exception as e:
+            logger.error(f"❌ Помилка збереження сесії: {e}")
+
+    def load_seen(self):
+        """
+        📂 Завантаження списку вже пересланих повідомлень з файлу seen_messages.json
+
+        Повертає OrderedDict з ключами (chat_id, message_id) у порядку пересилання
+        """
+        seen = OrderedDict()
+        try:
+            if os.path.exists(self.seen_file):
+                for chat_id, message_id in read_json_file(self.seen_file)[-MAX_SEEN_MESSAGES:]:
+                    seen[(chat_id, message_id)] = None
+        except Exception as e:
+            logger.error(f"❌ Помилка завантаження пересланих повідомлень: {e}")
+        return seen
+
+    def save_seen(self):
+        """
+        💾 Збереження списку вже пересланих повідомлень у файл seen_messages.json
+        """
+        try:
+            write_json_file(self.seen_file, [list(key) for key in self._seen])
+        except Exception as e:
+            logger.error(f"❌ Помилка збереження пересланих повідомлень: {e}")
+
+    def is_already_forwarded(self, chat_id, message_id):
+        """
+        🔁 Перевірка, чи повідомлення вже пересилалося або саме пересилається
+
+        Нове повідомлення резервується до надсилання сповіщення: після успіху його
+        позначає mark_forwarded, після помилки звільняє release_messages
+
+        Returns:
+            bool: True, якщо повідомлення вже пересилалося раніше або вже в черзі
+        """
+        key = (chat_id, message_id)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        if key in self._in_flight:
+            return True
+
+        self._in_flight.add(key)
+        return False
+
+    def mark_forwarded(self, keys):
+        """
+        ✅ Позначка повідомлень як пересланих (після успішного надсилання сповіщення)
+
+        Зберігаються лише останні MAX_SEEN_MESSAGES повідомлень (найстаріші видаляються)
+        """
+        for key in keys:
+            self._in_flight.discard(key)
+            self._seen[key] = None
+            self._seen.move_to_end(key)
+        while len(self._seen) > MAX_SEEN_MESSAGES:
+            self._seen.popitem(last=False)
+
+    def release_messages(self, keys):
+        """
+        ↩️ Звільнення повідомлень, сповіщення про які не вдалося надіслати
+
+        Вони не потрапляють у seen_messages.json, тож після перезапуску перевіряються знову
+        """
+        for key in keys:
+            self._in_flight.discard(key)
 
     async def start(self):
         """
@@ -130,29 +622,95 @@ class TelegramMonitor:
         Цей метод:
         1. Авторизується у Telegram (може запитати SMS код)
         2. Отримує список всіх груп/каналів
-        3. Запускає моніторинг повідомлень
-        4. Працює до зупинки (Ctrl+C)
+        3. Підписується на нові повідомлення (Telegram надсилає їх одразу, без опитування)
+        4. Перевіряє повідомлення, що надійшли за останні 5 хвилин до запуску
+        5. Працює до зупинки (Ctrl+C)
         """
         try:
             # 🔐 Авторизація в Telegram (може запитати SMS код при першому запуску)
             await self.client.start(phone=self.phone_number)
             logger.info("✅ Успішна авторизація в Telegram")
 
+            # 🔑 Експорт сесії рядком для наступних запусків (якщо вона змінилася)
+            self.save_session_string()
+
             # 👤 Отримання інформації про поточного користувача
             me = await self.client.get_me()
+            # 💾 Запам'ятовуємо власний ID, щоб не запитувати його для кожного повідомлення
+            self._me_id = me.id
             logger.info(f"👤 Авторизовано як: {me.first_name} {me.last_name or ''} (@{me.username or 'без username'})")
 
             # 📋 Отримання списку всіх груп та каналів для моніторингу
             await self.get_all_chats()
 
-            logger.info("🎯 Моніторинг розпочато. Перевірка кожні 5 хвилин...")
+            # 📬 Запуск фонового надсилання сповіщень пакетами
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+            # 📨 Підписка на нові вхідні повідомлення (власні повідомлення не надходять)
+            self.client.add_event_handler(self.on_new_message, events.NewMessage(incoming=True))
+
+            # 🔍 Перевірка повідомлень, що надійшли до запуску (повтори відсіює is_already_forwarded)
+            self.stats['total_messages_found'] += await self.check_recent_messages()
+
+            # 📊 Запуск фонової відправки статусу
+            self._status_task = asyncio.create_task(self.status_loop())
+
+            logger.info("🎯 Моніторинг розпочато. Нові повідомлення перевіряються одразу після надходження")
             logger.info("⏹️  Для зупинки натисніть Ctrl+C")
 
-            # 🔄 Безкінечний цикл моніторингу з перевіркою кожні 5 хвилин
-            await self.periodic_check_loop()
+            # 🔄 Робота до відключення від Telegram (або зупинки Ctrl+C)
+            await self.client.run_until_disconnected()
 
         except Exception as e:
             logger.error(f"❌ Помилка запуску: {e}")
+        finally:
+            # 📬 Зупинка фонових задач і надсилання сповіщень, що залишилися в черзі
+            await self.stop_background_tasks()
+            # 💾 Збереження пересланих повідомлень при зупинці (у т.ч. Ctrl+C)
+            self.save_seen()
+
+    async def stop_background_tasks(self):
+        """
+        ⏹️ Зупинка фонових задач і надсилання залишку черги сповіщень
+
+        _flush_loop не скасовується, а отримує сигнал _FLUSH_STOP у кінці черги: так надсилаються
+        і сповіщення, які він уже забрав з черги у поточний пакет.
+        Не надіслані за SHUTDOWN_FLUSH_TIMEOUT сповіщення не позначаються пересланими
+        """
+        if self._status_task is not None:
+            self._status_task.cancel()
+            await asyncio.gather(self._status_task, return_exceptions=True)
+
+        if self._flush_task is None or self._flush_task.done():
+            return
+        try:
+            await asyncio.wait_for(self._stop_flush_loop(), SHUTDOWN_FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error("❌ Не вдалося надіслати всі сповіщення з черги при зупинці")
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+    async def _stop_flush_loop(self):
+        """
+        ⏹️ Постановка сигналу зупинки в чергу та очікування завершення _flush_loop
+        """
+        await self._out_q.put(_FLUSH_STOP)
+        await self._flush_task
+
+    async def get_monitored_dialogs(self):
+        """
+        📋 Отримання груп/каналів для моніторингу
+
+        Повний список діалогів запитується один раз: get_all_chats і check_recent_messages
+        при запуску використовують той самий список, а нові повідомлення надходять через
+        on_new_message і списку не потребують. З нього одразу відбираються лише групи та канали
+        """
+        if self._monitored_dialogs is None:
+            # 📞 Отримання всіх діалогів (чатів) користувача
+            dialogs = await self.client.get_dialogs()
+            # 🔍 Фільтрація тільки груп та каналів (пропускаємо приватні чати)
+            self._monitored_dialogs = [dialog for dialog in dialogs if dialog.is_group or dialog.is_channel]
+        return self._monitored_dialogs
 
     async def get_all_chats(self):
         """
@@ -162,18 +720,16 @@ class TelegramMonitor:
         Скрипт буде моніторити повідомлення тільки в цих чатах
         """
         try:
-            # 📞 Отримання всіх діалогів (чатів) користувача
-            dialogs = await self.client.get_dialogs()
+            # 📞 Отримання груп та каналів (приватні чати вже відфільтровані)
+            dialogs = await self.get_monitored_dialogs()
             groups = []
 
-            # 🔍 Фільтрація тільки груп та каналів (пропускаємо приватні чати)
             for dialog in dialogs:
-                if dialog.is_group or dialog.is_channel:
-                    groups.append({
-                        'id': dialog.id,
-                        'title': dialog.title,
-                        'type': 'канал' if dialog.is_channel else 'група'
-                    })
+                groups.append({
+                    'id': dialog.id,
+                    'title': dialog.title,
+                    'type': 'канал' if dialog.is_channel else 'група'
+                })
 
             # 📊 Виведення статистики знайдених груп/каналів
             logger.info(f"📊 Знайдено {len(groups)} груп/каналів для моніторингу:")
@@ -183,49 +739,92 @@ class TelegramMonitor:
         except Exception as e:
             logger.error(f"❌ Помилка отримання списку чатів: {e}")
 
-    async def periodic_check_loop(self):
+    async def on_new_message(self, event):
         """
-        🔄 Основний цикл періодичної перевірки повідомлень кожні 5 хвилин
-        з відправкою статусу кожні 10 хвилин
+        📨 Обробка нового повідомлення (Telethon викликає її одразу після надходження)
+
+        Чат і відправник запитуються лише для повідомлень із ключовими словами
         """
+        try:
+            # 🔍 Моніторимо тільки групи та канали (пропускаємо приватні чати)
+            if not (event.is_group or event.is_channel):
+                return
+
+            message_text = event.raw_text
+            if not message_text:
+                return
+
+            self.stats['messages_checked'] += 1
+            found_keywords = self.check_keywords(message_text)
+            if not found_keywords:
+                return
+
+            # 💬 Чат запитується до резервування, щоб помилка запиту не залишила повідомлення в _in_flight
+            chat = await event.get_chat()
+
+            # 🔁 Пропускаємо повідомлення, яке вже пересилалося
+            if self.is_already_forwarded(event.chat_id, event.id):
+                return
+
+            self.stats['total_messages_found'] += 1
+            # 📤 Пересилання повідомлення з ключовими словами
+            await self.forward_message(event.message, utils.get_display_name(chat), event.chat_id, found_keywords)
+
+        except Exception as e:
+            logger.error(f"❌ Помилка обробки нового повідомлення: {e}")
+
+    async def status_loop(self):
+        """
+        📊 Фонова відправка статусу кожні 10 хвилин (STATUS_INTERVAL)
+
+        Час наступного статусу рахується від розкладу за монотонним годинником циклу подій,
+        а не від завершення попередньої відправки, тому період не "зсувається" з часом
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + STATUS_INTERVAL
+
         while True:
+            now = None
             try:
-                logger.info("🔍 Початок перевірки нових повідомлень...")
-                messages_found = await self.check_recent_messages()
-                self.stats['total_checks'] += 1
-                self.stats['total_messages_found'] += messages_found
-                
-                logger.info("✅ Перевірка завершена. Очікування 5 хвилин...")
-                
-                # 📊 Перевірка чи потрібно відправити статус (кожні 10 хвилин)
-                await self.check_and_send_status()
-                
-                # ⏰ Очікування 5 хвилин (300 секунд)
-                await asyncio.sleep(300)
-                
+                await asyncio.sleep(max(0, next_tick - loop.time()))
+
+                # ⏰ Один знімок часу на весь цикл замість окремого datetime.now() у кожному методі
+                tick_time = loop.time()
+                now = datetime.now(timezone.utc)
+
+                next_tick += STATUS_INTERVAL
+                # ⏭️ Якщо пропущено кілька періодів (напр. після сну комп'ютера) - не надсилаємо їх усі підряд
+                if next_tick <= tick_time:
+                    next_tick = tick_time + STATUS_INTERVAL
+                # ⚠️ Помилки статусу (напр. змінений STATUS_TEMPLATE з невідомим полем) обробляються нижче
+                await self.send_status_message(now)
+
+                # 💾 Періодичне збереження пересланих повідомлень (на випадок аварійної зупинки)
+                self.save_seen()
+
             except Exception as e:
-                logger.error(f"❌ Помилка в циклі перевірки: {e}")
+                logger.error(f"❌ Помилка у циклі статусу: {e}")
                 # Відправка повідомлення про помилку
-                await self.send_error_notification(str(e))
-                # Очікування 1 хвилину перед повторною спробою при помилці
-                await asyncio.sleep(60)
+                await self.send_error_notification(str(e), now)
+                # Повторна спроба через ERROR_RETRY_DELAY секунд після помилки
+                next_tick = loop.time() + ERROR_RETRY_DELAY
 
     async def check_recent_messages(self):
         """
-        🔍 Перевірка повідомлень за останні 5 хвилин у всіх групах/каналах
+        🔍 Перевірка повідомлень, що надійшли до запуску (за останні 5 хвилин), у всіх групах/каналах
         Повертає кількість знайдених повідомлень з ключовими словами
         """
-        total_found = 0
         try:
-            # 📞 Отримання всіх діалогів (чатів) користувача
-            dialogs = await self.client.get_dialogs()
+            # 📞 Отримання груп/каналів (список вже отримано у get_all_chats)
+            dialogs = await self.get_monitored_dialogs()
             current_time = datetime.now(timezone.utc)
             
-            # 🔍 Перевірка кожної групи/каналу
-            for dialog in dialogs:
-                if dialog.is_group or dialog.is_channel:
-                    found_in_chat = await self.check_chat_messages(dialog, current_time)
-                    total_found += found_in_chat
+            # 🔍 Паралельна перевірка всіх груп/каналів (кількість одночасних запитів обмежена семафором)
+            results = await asyncio.gather(
+                *(self.check_chat_messages(dialog, current_time) for dialog in dialogs),
+                return_exceptions=True
+            )
+            total_found = sum(result for result in results if isinstance(result, int))
             
             # 📅 Оновлення часу останньої перевірки
             self.last_check_time = current_time
@@ -238,40 +837,50 @@ class TelegramMonitor:
 
     async def check_chat_messages(self, dialog, current_time):
         """
-        📋 Перевірка повідомлень в конкретному чаті за останні 5 хвилин
+        📋 Перевірка повідомлень в конкретному чаті, що надійшли після last_check_time
         Повертає кількість знайдених повідомлень з ключовими словами
         """
         messages_with_keywords = 0
         try:
-            # 📥 Отримання останніх повідомлень (збільшуємо ліміт для надійності)
-            messages = await self.client.get_messages(
-                dialog,
-                limit=200  # Збільшений ліміт для кращого покриття
-            )
-            
+            # ⏭️ Останнє повідомлення чату старіше за last_check_time - нових повідомлень немає
+            if dialog.date and dialog.date <= self.last_check_time:
+                return 0
+
             messages_checked = 0
-            
-            # 🔎 Перевірка кожного повідомлення
-            for message in messages:
-                # ⏰ Перевірка чи повідомлення новіше за час останньої перевірки
-                if message.date <= self.last_check_time:
-                    continue
-                    
-                messages_checked += 1
-                
-                # 🚫 Пропускаємо власні повідомлення
-                if message.sender_id == (await self.client.get_me()).id:
-                    continue
-                
-                # 📄 Перевірка тексту повідомлення
-                if message.message:
-                    found_keywords = self.check_keywords(message.message)
-                    
-                    if found_keywords:
-                        messages_with_keywords += 1
-                        # 📤 Пересилання повідомлення з ключовими словами
-                        await self.forward_message_from_history(message, dialog, found_keywords)
-            
+
+            # 📥 Потокове отримання лише повідомлень, новіших за last_check_time (фільтрує сервер Telegram):
+            # повідомлення обробляються по мірі надходження, без накопичення всього списку в пам'яті
+            async with self._fetch_semaphore:
+                async for message in self.client.iter_messages(
+                    dialog,
+                    offset_date=self.last_check_time,
+                    reverse=True,  # Від offset_date вперед, від старіших до новіших
+                    limit=200  # Обмеження на випадок дуже активного чату
+                ):
+                    # ⏰ Перевірка чи повідомлення новіше за час останньої перевірки
+                    if message.date <= self.last_check_time:
+                        continue
+
+                    messages_checked += 1
+
+                    # 🚫 Пропускаємо власні повідомлення
+                    if message.sender_id == self._me_id:
+                        continue
+
+                    # 📄 Перевірка тексту повідомлення
+                    if message.message:
+                        found_keywords = self.check_keywords(message.message)
+
+                        if found_keywords:
+                            # 🔁 Пропускаємо повідомлення, яке вже пересилалося (напр. до перезапуску)
+                            if self.is_already_forwarded(dialog.id, message.id):
+                                continue
+
+                            messages_with_keywords += 1
+                            # 📤 Пересилання повідомлення з ключовими словами
+                            await self.forward_message(message, dialog.title, dialog.id, found_keywords)
+
+            self.stats['messages_checked'] += messages_checked
             if messages_checked > 0:
                 logger.info(f"📊 {dialog.title}: перевірено {messages_checked} повідомлень, знайдено {messages_with_keywords} з ключовими словами")
             
@@ -281,18 +890,50 @@ class TelegramMonitor:
             logger.error(f"❌ Помилка перевірки чату {dialog.title}: {e}")
             return 0
 
-    async def forward_message_from_history(self, message, dialog, keywords):
+    async def get_sender(self, message):
         """
-        📤 Пересилання повідомлення з історії з ключовими словами
+        👤 Отримання відправника повідомлення з кешуванням
+
+        Telethon зазвичай вже має відправника разом з повідомленням; якщо ні - спершу
+        перевіряється кеш, і лише потім виконується запит до Telegram
         """
-        try:
-            # 👤 Отримання інформації про відправника
+        sender_id = message.sender_id
+        sender = message.sender
+        if sender is None and sender_id in self._sender_cache:
+            sender = self._sender_cache[sender_id]
+        if sender is None:
             sender = await message.get_sender()
+
+        # 💾 Оновлення кешу (анонімні повідомлення без sender_id не кешуються)
+        if sender is not None and sender_id is not None:
+            self._sender_cache[sender_id] = sender
+            self._sender_cache.move_to_end(sender_id)
+            if len(self._sender_cache) > MAX_CACHED_SENDERS:
+                self._sender_cache.popitem(last=False)
+
+        return sender
+
+    async def forward_message(self, message, chat_title, chat_id, keywords):
+        """
+        📤 Пересилання повідомлення з ключовими словами
+
+        Args:
+            message: Повідомлення Telethon (нове або з історії)
+            chat_title: Назва групи/каналу
+            chat_id: ID групи/каналу
+            keywords: Знайдені ключові слова
+        """
+        key = (chat_id, message.id)
+        try:
+            # 👤 Отримання інформації про відправника (з кешу, якщо можливо)
+            sender = await self.get_sender(message)
             
             # 📝 Формування інформації про повідомлення
-            chat_name = getattr(dialog, 'title', 'Невідомий чат')
-            sender_name = f"{getattr(sender, 'first_name', '')} {getattr(sender, 'last_name', '') or ''}".strip()
-            sender_username = getattr(sender, 'username', '')
+            # (get_display_name працює і для користувачів, і для каналів)
+            chat_name = chat_title or 'Невідомий чат'
+            sender_name = utils.get_display_name(sender)
+            # username є не в усіх типів відправників (напр. у звичайних груп Chat його немає)
+            sender_username = getattr(sender, 'username', None)
 
             # 👤 Формування інформації про відправника
             if sender_username:
@@ -300,95 +941,180 @@ class TelegramMonitor:
             else:
                 sender_info = sender_name or "Невідомий користувач"
 
-            # 📋 Створення детального сповіщення
-            notification_text = f"""
-🔔 ЗНАЙДЕНО КЛЮЧОВІ СЛОВА: {', '.join(keywords)}
+            # 📋 Створення детального сповіщення за шаблоном
+            fields = {
+                'keywords': ', '.join(keywords),
+                'chat': chat_name,
+                'sender': sender_info,
+                'date': message.date.strftime(DATE_FORMAT),
+                'text': message.message,
+                'message_id': message.id,
+                'chat_id': chat_id,
+            }
+            notification_text = NOTIFICATION_TEMPLATE.format_map(fields)
+
+            # ✂️ Задовге сповіщення - скорочується текст повідомлення, а не ID повідомлення і чату в кінці
+            excess = telegram_length(notification_text) - MAX_MESSAGE_LENGTH
+            if excess > 0:
+                fields['text'] = truncate_text(message.message, telegram_length(message.message) - excess)
+                notification_text = NOTIFICATION_TEMPLATE.format_map(fields)
+
+            # 📬 Постановка сповіщення в чергу (надсилається пакетом у _flush_loop)
+            await self.queue_notification(notification_text, (key,))
+
+            logger.info(f"📬 У черзі сповіщення з ключовими словами {keywords} з чату '{chat_name}'")
 
-📍 Група/Канал: {chat_name}
-👤 Відправник: {sender_info}
-📅 Час: {message.date.strftime('%Y-%m-%d %H:%M:%S')}
+        except Exception as e:
+            self.release_messages((key,))
+            logger.error(f"❌ Помилка пересилання повідомлення: {e}")
 
-💬 Повідомлення:
-{message.message}
+    async def queue_notification(self, text, keys=()):
+        """
+        📬 Постановка тексту в чергу надсилання цільовому користувачу
 
----
-ID повідомлення: {message.id}
-ID чату: {dialog.id}
-            """.strip()
+        Усі повідомлення бота (сповіщення, статус, помилки) надсилаються через цю чергу.
+        Текст, довший за ліміт Telegram (у кодових одиницях UTF-16), обрізається,
+        щоб не зламати надсилання всього пакета
 
-            # 📨 Надсилання сповіщення цільовому користувачу
-            await self.client.send_message(self.target_user_id, notification_text)
+        Args:
+            text: Текст повідомлення
+            keys: Повідомлення (chat_id, message_id), що позначаються пересланими після надсилання
+        """
+        await self._out_q.put((truncate_text(text, MAX_MESSAGE_LENGTH), keys))
 
-            logger.info(f"✅ Переслано повідомлення з ключовими словами {keywords} з чату '{chat_name}'")
+    async def send_batch(self, batch):
+        """
+        📨 Надсилання пакета сповіщень цільовому користувачу
 
-        except Exception as e:
-            logger.error(f"❌ Помилка пересилання повідомлення: {e}")
+        Повідомлення з пакета позначаються пересланими лише після успішного надсилання.
+        Якщо пакет не вдалося надіслати, сповіщення надсилаються по одному, щоб одне
+        проблемне сповіщення не забрало з собою решту пакета
 
-    async def check_and_send_status(self):
-        """
-        📊 Перевірка чи потрібно відправити статус повідомлення (кожні 10 хвилин)
+        Args:
+            batch: Список пар (текст, ключі повідомлень) з черги
         """
+        keys = [key for _, item_keys in batch for key in item_keys]
         try:
-            current_time = datetime.now(timezone.utc)
-            time_since_last_status = current_time - self.last_status_time
-            
-            # 🕙 Якщо пройшло 10 хвилин або більше - відправляємо статус
-            if time_since_last_status >= timedelta(minutes=10):
-                await self.send_status_message()
-                self.last_status_time = current_time
-                
+            await self.client.send_message(self.target_user_id, BATCH_SEPARATOR.join(text for text, _ in batch))
         except Exception as e:
-            logger.error(f"❌ Помилка перевірки статусу: {e}")
-
-    async def send_status_message(self):
+            if len(batch) == 1:
+                self.release_messages(keys)
+                raise
+
+            logger.error(f"❌ Пакет з {len(batch)} сповіщень не надіслано ({e}), надсилання по одному")
+            for item in batch:
+                try:
+                    await self.send_batch([item])
+                except Exception as item_error:
+                    logger.error(f"❌ Помилка надсилання сповіщення: {item_error}")
+            return
+
+        self.mark_forwarded(keys)
+        logger.info(f"📨 Надіслано пакет з {len(batch)} сповіщень")
+
+    async def _flush_loop(self):
         """
-        📈 Відправка статус повідомлення про роботу бота
+        📬 Фонове надсилання сповіщень з черги пакетами
+
+        Сповіщення, що надійшли протягом MAX_WAIT_MS, об'єднуються в одне повідомлення
+        (не більше MAX_BATCH штук і не довше MAX_MESSAGE_LENGTH за підрахунком Telegram).
+        Так менше запитів send_message і менше ризик отримати FloodWait від Telegram.
+        Завершується після сигналу _FLUSH_STOP, надіславши все, що надійшло до нього
         """
-        try:
-            current_time = datetime.now(timezone.utc)
-            uptime = current_time - self.stats['start_time']
-            
-            # 📊 Формування статистики
-            hours = int(uptime.total_seconds() // 3600)
-            minutes = int((uptime.total_seconds() % 3600) // 60)
-            
-            status_text = f"""
-🤖 СТАТУС БОТА - БОТ ПРАЦЮЄ
+        loop = asyncio.get_running_loop()
+        pending = None
 
-⏰ Час роботи: {hours}г {minutes}хв
-🔍 Всього перевірок: {self.stats['total_checks']}
-📨 Знайдено повідомлень: {self.stats['total_messages_found']}
-📅 Останнє оновлення: {current_time.strftime('%Y-%m-%d %H:%M:%S')}
+        while True:
+            try:
+                # ⏳ Очікування першого сповіщення (або залишку з попереднього пакета)
+                item = pending if pending is not None else await self._out_q.get()
+                pending = None
+                if item is _FLUSH_STOP:
+                    return
+
+                batch = [item]
+                length = telegram_length(item[0])
+                deadline = loop.time() + MAX_WAIT_MS / 1000
+
+                # 📥 Збір наступних сповіщень до заповнення пакета або завершення очікування
+                while len(batch) < MAX_BATCH:
+                    try:
+                        item = self._out_q.get_nowait()
+                    except asyncio.QueueEmpty:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(self._out_q.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+
+                    # ✂️ Сповіщення, що не вміщується в ліміт Telegram (і сигнал зупинки),
+                    # переходить у наступний пакет
+                    if item is _FLUSH_STOP:
+                        pending = item
+                        break
+                    item_length = telegram_length(item[0])
+                    if length + len(BATCH_SEPARATOR) + item_length > MAX_MESSAGE_LENGTH:
+                        pending = item
+                        break
+
+                    batch.append(item)
+                    length += len(BATCH_SEPARATOR) + item_length
+
+                # 📨 Надсилання пакета (не надіслані повідомлення не позначаються пересланими)
+                await self.send_batch(batch)
 
-✅ Бот активний та моніторить групи кожні 5 хвилин
-🔑 Ключових слів у базі: {len(self.keywords)}
+            except Exception as e:
+                logger.error(f"❌ Помилка надсилання пакета сповіщень: {e}")
 
----
-Наступний статус через 10 хвилин
-            """.strip()
+    async def send_status_message(self, now=None):
+        """
+        📈 Відправка статус повідомлення про роботу бота
 
-            # 📨 Відправка статус повідомлення
-            await self.client.send_message(self.target_user_id, status_text)
-            logger.info("📊 Відправлено статус повідомлення")
-            
-        except Exception as e:
-            logger.error(f"❌ Помилка відправки статусу: {e}")
+        Помилки не перехоплюються: їх обробляє status_loop (повідомлення про помилку
+        та повторна спроба через ERROR_RETRY_DELAY секунд)
 
-    async def send_error_notification(self, error_message):
+        Args:
+            now: Поточний час (datetime з timezone), якщо вже отриманий викликаючим кодом
+        """
+        current_time = now or datetime.now(timezone.utc)
+        uptime_seconds = time.monotonic() - self.stats['start_monotonic']
+
+        # 📊 Формування статистики
+        hours = int(uptime_seconds // 3600)
+        minutes = int((uptime_seconds % 3600) // 60)
+
+        status_text = STATUS_TEMPLATE.format_map({
+            'hours': hours,
+            'minutes': minutes,
+            'messages_checked': self.stats['messages_checked'],
+            'messages_found': self.stats['total_messages_found'],
+            'date': current_time.strftime(DATE_FORMAT),
+            'keywords_count': len(self.keywords),
+            'next_status': STATUS_INTERVAL // 60,
+        })
+
+        # 📬 Постановка статус повідомлення в чергу надсилання
+        await self.queue_notification(status_text)
+        logger.info("📊 Відправлено статус повідомлення")
+
+    async def send_error_notification(self, error_message, now=None):
         """
         ⚠️ Відправка повідомлення про помилку
+
+        Args:
+            error_message: Опис помилки
+            now: Час циклу статусу, під час якого сталася помилка (None - поточний час)
         """
         try:
-            error_text = f"""
-⚠️ ПОМИЛКА В РОБОТІ БОТА
-
-❌ Опис помилки: {error_message}
-📅 Час помилки: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}
-
-🔄 Бот спробує відновити роботу через 1 хвилину
-            """.strip()
+            error_text = ERROR_TEMPLATE.format_map({
+                'error': error_message,
+                'date': (now or datetime.now(timezone.utc)).strftime(DATE_FORMAT),
+                'retry_delay': ERROR_RETRY_DELAY,
+            })
 
-            await self.client.send_message(self.target_user_id, error_text)
+            await self.queue_notification(error_text)
             logger.info("⚠️ Відправлено повідомлення про помилку")
             
         except Exception as e:
@@ -467,7 +1193,12 @@ if __name__ == '__main__':
 
     try:
         # 🏃 Запуск асинхронної головної функції
-        asyncio.run(main())
+        # 🏎️ на uvloop замість стандартного циклу подій (якщо встановлено).
+        # uvloop.run замість застарілого з Python 3.12 uvloop.install()
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n⏹️  Моніторинг зупинено користувачем")
     except Exception as e: